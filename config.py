@@ -1,27 +1,83 @@
+import copy
 import json
 import os
 
 CONFIG_FILE = "config.json"
 
+_cached_cfg = None
+_cached_mtime = None
+_last_saved_blob = None
+
+
+def _default_config():
+    return {"folders": [], "shuffle": False, "duration": 5}
+
+
+def _config_mtime():
+    try:
+        return os.stat(CONFIG_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
 def save_config(folders, shuffle, duration):
-    with open(CONFIG_FILE, "w") as f:
-        json.dump({
-            "folders": folders,
-            "shuffle": shuffle,
-            "duration": duration
-        }, f)
+    global _cached_cfg, _cached_mtime, _last_saved_blob
+
+    data = {
+        "folders": folders,
+        "shuffle": shuffle,
+        "duration": duration
+    }
+    blob = json.dumps(data, separators=(",", ":"))
+    # Skip the write only while the file on disk is still the one we wrote.
+    if (
+        blob == _last_saved_blob
+        and _cached_mtime is not None
+        and _config_mtime() == _cached_mtime
+    ):
+        return
+
+    # Write to a temporary file and swap it in so a crash never leaves a
+    # half-written config behind.
+    tmp_path = CONFIG_FILE + ".tmp"
+    with open(tmp_path, "w") as f:
+        f.write(blob)
+        # Make the data durable before the rename; otherwise a power cut on
+        # the SD card can leave an empty file behind the new name.
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, CONFIG_FILE)
+    _last_saved_blob = blob
+
+    # Refresh the read cache so the next load_config() skips the disk round-trip.
+    _cached_cfg = copy.deepcopy(data)
+    _cached_mtime = _config_mtime()
+
 
 def load_config():
-    if not os.path.exists(CONFIG_FILE):
-        return {"folders": [], "shuffle": False, "duration": 5}
+    global _cached_cfg, _cached_mtime, _last_saved_blob
+
+    mtime = _config_mtime()
+    if mtime is None:
+        return _default_config()
+    if _cached_cfg is not None and mtime == _cached_mtime:
+        return copy.deepcopy(_cached_cfg)
+
     try:
         with open(CONFIG_FILE, "r") as f:
             data = json.load(f)
-            return {
+            config = {
                 "folders": data.get("folders", []),
                 "shuffle": data.get("shuffle", False),
                 "duration": data.get("duration", 5)
             }
     except Exception as e:
         print(f"Failed to load config: {e}")
-        return {"folders": [], "shuffle": False, "duration": 5}
+        return _default_config()
+
+    _cached_cfg = config
+    _cached_mtime = mtime
+    # The file changed behind our back, so the last blob we wrote no longer
+    # describes what is on disk.
+    _last_saved_blob = None
+    return copy.deepcopy(config)
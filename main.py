@@ -1,11 +1,20 @@
 import sys
 
+from PyQt6.QtGui import QSurfaceFormat
 from PyQt6.QtWidgets import QApplication
 
 from ui.main_window import MainWindow
 
 
 def main():
+    # The slideshow viewport renders through OpenGL when a context can be
+    # created (it falls back to raster otherwise); request vsynced double
+    # buffering before the application creates any GL surfaces.
+    surface_format = QSurfaceFormat()
+    surface_format.setSwapBehavior(QSurfaceFormat.SwapBehavior.DoubleBuffer)
+    surface_format.setSwapInterval(1)
+    QSurfaceFormat.setDefaultFormat(surface_format)
+
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
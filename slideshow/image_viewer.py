@@ -3,6 +3,11 @@ import math
 import random
 import os
 import html
+import time
+import re
+import functools
+import hashlib
+from collections import OrderedDict
 from datetime import datetime, date
 from dataclasses import asdict, is_dataclass
 from pathlib import Path
@@ -15,19 +20,36 @@ from PyQt6.QtCore import (
     QEasingCurve,
     QPointF,
     QUrl,
+    QRunnable,
+    QThreadPool,
+    QMutex,
+    QPropertyAnimation,
+    QParallelAnimationGroup,
+    QAbstractAnimation,
+    QObject,
+    pyqtSignal,
 )
 from PyQt6.QtGui import (
+    QImage,
+    QImageIOHandler,
+    QImageReader,
     QPixmap,
     QTransform,
     QPainter,
+    QColor,
     QFont,
     QFontMetrics,
     QFontDatabase,
+    QOpenGLContext,
+    QPen,
 )
 from PyQt6.QtWidgets import (
     QGraphicsView,
     QGraphicsScene,
     QGraphicsPixmapItem,
+    QGraphicsRectItem,
+    QGraphicsItem,
+    QGraphicsWidget,
     QSizePolicy,
     QLabel,
     QWidget,
@@ -35,9 +57,12 @@ from PyQt6.QtWidgets import (
     QVBoxLayout,
 )
 from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
+from PyQt6.QtOpenGLWidgets import QOpenGLWidget
 
 from PIL import Image, ExifTags
 
+from utils.exif_reader import EXIF_IFD_POINTER_TAG, read_exif_dates
+
 SUPPORTED_TRANSITIONS = [
     "crossfade",
     "slide-horizontal",
@@ -48,10 +73,165 @@ SUPPORTED_TRANSITIONS = [
     "pixelate",
 ]
 
-SUPPORTED_TRANSITIONS_SET = set(SUPPORTED_TRANSITIONS)
+SUPPORTED_TRANSITIONS_SET = frozenset(SUPPORTED_TRANSITIONS)
+
+# Mosaic and pixelate redraw from Python; cap them at roughly 30 fps.
+TRANSITION_FRAME_INTERVAL_MS = 33
+
+# An interrupted transition's last frame fades out over the next image.
+INTERRUPTED_FADE_MS = 400
+
+# Window resizes arrive in bursts; refit once they settle for this long.
+RESIZE_DEBOUNCE_MS = 80
+
+# Unit vectors for the Ken Burns pan, computed once instead of per slide.
+MOTION_PAN_DIRECTIONS = tuple(
+    (math.cos(2 * math.pi * step / 64), math.sin(2 * math.pi * step / 64))
+    for step in range(64)
+)
+
+# Images are decoded at most this much larger than the physical viewport;
+# motion never scales up by more than 1.2x and the zoom transition is
+# clamped to this headroom.
+PRESCALE_HEADROOM = 1.25
+
+# Decoded images kept for reuse, bounded by count and by pixel memory.
+IMAGE_CACHE_MAX_ENTRIES = 4
+IMAGE_CACHE_MAX_BYTES = 200 * 1024 * 1024
+# Prescaled pixmaps of the most recently shown images, for going back.
+PIXMAP_CACHE_MAX_ENTRIES = 2
+
+ICON_CACHE_DIR = Path.home() / ".cache" / "pi5-photo-viewer" / "icons"
+# Emoji font path resolved by a previous launch; empty when none was found.
+EMOJI_FONT_CACHE_FILE = ICON_CACHE_DIR.parent / "emoji-font-path"
 
 EXIF_DATE_TAG_NAMES = ("DateTimeOriginal", "DateTimeDigitized", "DateTime")
 EXIF_TAG_NAME_TO_ID = {name: tag for tag, name in ExifTags.TAGS.items()}
+# (name, tag id) pairs in priority order, resolved once at import.
+EXIF_DATE_TAGS = tuple(
+    (name, EXIF_TAG_NAME_TO_ID[name])
+    for name in EXIF_DATE_TAG_NAMES
+    if name in EXIF_TAG_NAME_TO_ID
+)
+EXIF_DATETIME_TRANSLATION = str.maketrans({"/": "-", "T": " ", "\u0000": None})
+
+
+@functools.lru_cache(maxsize=512)
+def _folder_name_for_path(image_path):
+    # Plain string splitting; building a Path object costs more than the lookup.
+    parent, _ = os.path.split(image_path)
+    return os.path.basename(parent)
+
+
+@functools.lru_cache(maxsize=1)
+def _opengl_available():
+    # Probe once with a throwaway context; on a Pi without a working KMS/GL
+    # stack this fails and the view keeps its raster viewport.
+    return QOpenGLContext().create()
+
+
+@functools.lru_cache(maxsize=1)
+def _month_names():
+    # Resolved once through strftime so the names still follow the locale
+    # Qt sets up at startup.
+    return tuple(date(2000, month, 1).strftime("%B") for month in range(1, 13))
+
+
+def _format_month_day_year(year, month, day):
+    return f"{_month_names()[month - 1]} {day}, {year}"
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_photo_date(image_path, mtime_ns, size):
+    return ImageViewer._extract_photo_date(image_path)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_exif_datetime_text(text):
+    """Parse the usual ``YYYY:MM:DD[ HH:MM[:SS]]`` EXIF shapes by slicing.
+
+    Returns ``None`` for anything else so the caller can try strptime.
+    """
+    length = len(text)
+    if length not in (10, 16, 19):
+        return None
+    if text[4] not in ":-" or text[7] != text[4] or not text[0:4].isdigit():
+        return None
+    if length > 10 and (text[10] != " " or text[13] != ":"):
+        return None
+    if length == 19 and text[16] != ":":
+        return None
+    try:
+        fields = [int(text[0:4]), int(text[5:7]), int(text[8:10])]
+        if length > 10:
+            fields += [int(text[11:13]), int(text[14:16])]
+        if length == 19:
+            fields.append(int(text[17:19]))
+        return datetime(*fields)
+    except ValueError:
+        return None
+
+
+class _DecodeTask(QRunnable):
+    """Decodes an image off the GUI thread and hands it to ``callback``.
+
+    When ``target_size`` is not empty, images larger than it are decoded straight
+    to a size that fits it, which lets the JPEG decoder skip most of the work.
+    """
+
+    def __init__(self, image_path, target_size, callback):
+        super().__init__()
+        self.image_path = image_path
+        self.target_size = target_size
+        self.callback = callback
+
+    def run(self):
+        reader = QImageReader(self.image_path)
+        # Apply the EXIF orientation so portrait photos come out upright.
+        reader.setAutoTransform(True)
+        source_size = reader.size()
+        # size() and setScaledSize() are in stored orientation and the
+        # rotation is applied after scaling, so fit the upright size to the
+        # target and turn the result back.
+        rotated = bool(
+            reader.transformation() & QImageIOHandler.Transformation.TransformationRotate90
+        )
+        if rotated:
+            source_size = source_size.transposed()
+        if (
+            not self.target_size.isEmpty()
+            and source_size.isValid()
+            and (
+                source_size.width() > self.target_size.width()
+                or source_size.height() > self.target_size.height()
+            )
+        ):
+            scaled = source_size.scaled(self.target_size, Qt.AspectRatioMode.KeepAspectRatio)
+            reader.setScaledSize(scaled.transposed() if rotated else scaled)
+        self.callback(self.image_path, reader.read())
+
+
+class _MetadataTask(QRunnable):
+    """Warms the photo date cache for ``image_paths`` off the GUI thread."""
+
+    def __init__(self, image_paths):
+        super().__init__()
+        self.image_paths = image_paths
+
+    def run(self):
+        for image_path in self.image_paths:
+            try:
+                stat = os.stat(image_path)
+            except (OSError, ValueError):
+                continue
+            _cached_photo_date(image_path, stat.st_mtime_ns, stat.st_size)
+
+
+class _LoadSignals(QObject):
+    # Emitted from the decode thread; delivered queued on the GUI thread.
+    loaded = pyqtSignal(int, str, QImage)
+    # A sharper decode of the image already on screen, after the view grew.
+    refreshed = pyqtSignal(str, QImage)
 
 
 class ImageViewer(QGraphicsView):
@@ -75,6 +255,22 @@ class ImageViewer(QGraphicsView):
         "🌨️",
         "🌨",
     )
+    # Longest sequences first so a variation selector is wrapped together
+    # with its base emoji; one pass also keeps the bare base emoji from being
+    # wrapped a second time inside an existing span.
+    _WEATHER_EMOJI_RE = re.compile(
+        "|".join(
+            re.escape(html.escape(sequence))
+            for sequence in sorted(_WEATHER_EMOJI_SEQUENCES, key=len, reverse=True)
+            if sequence
+        )
+    )
+    _EMOJI_FONT_FAMILIES = (
+        "Noto Color Emoji",
+        "Segoe UI Emoji",
+        "Apple Color Emoji",
+        "Twemoji Mozilla",
+    )
 
     def __init__(
         self,
@@ -90,20 +286,63 @@ class ImageViewer(QGraphicsView):
         self.date_font_size = self._sanitize_font_size(date_font_size)
         self.weather_font_size = self._sanitize_font_size(weather_font_size)
         self.scene = QGraphicsScene(self)
+        # The scene never holds more than a few dozen items, so a BSP index
+        # costs more to maintain than it saves.
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
         self.setScene(self.scene)
         self.setBackgroundBrush(Qt.GlobalColor.black)
         self.scene.setBackgroundBrush(Qt.GlobalColor.black)
 
-        self.pixmap_item = QGraphicsPixmapItem()
-        self.pixmap_item.setZValue(0)
-        self.scene.addItem(self.pixmap_item)
-
-        self.next_pixmap_item = QGraphicsPixmapItem()
-        self.next_pixmap_item.setVisible(False)
-        self.next_pixmap_item.setOpacity(0.0)
-        self.next_pixmap_item.setZValue(1)
-        self.scene.addItem(self.next_pixmap_item)
-
+        # Each pixmap item sits inside a content-less QGraphicsWidget layer.
+        # The layers expose opacity/pos/scale/rotation as Qt properties so
+        # transitions can be driven by QPropertyAnimation entirely in C++.
+        self.pixmap_layer = self._create_pixmap_layer(0)
+        self.pixmap_item = QGraphicsPixmapItem(self.pixmap_layer)
+
+        self.next_pixmap_layer = self._create_pixmap_layer(1)
+        self.next_pixmap_layer.setVisible(False)
+        self.next_pixmap_layer.setOpacity(0.0)
+        self.next_pixmap_item = QGraphicsPixmapItem(self.next_pixmap_layer)
+
+        # Frozen copy of an interrupted transition's last frame, faded out over
+        # the new image so skipping ahead mid-transition does not snap.
+        self.frozen_frame_layer = self._create_pixmap_layer(4)
+        self.frozen_frame_layer.setVisible(False)
+        self.frozen_frame_item = QGraphicsPixmapItem(self.frozen_frame_layer)
+        self.frozen_frame_item.setTransformationMode(Qt.TransformationMode.SmoothTransformation)
+        self._frozen_frame_fade = QPropertyAnimation(self.frozen_frame_layer, b"opacity", self)
+        self._frozen_frame_fade.setDuration(INTERRUPTED_FADE_MS)
+        self._frozen_frame_fade.setEasingCurve(QEasingCurve.Type.InOutCubic)
+        self._frozen_frame_fade.setStartValue(1.0)
+        self._frozen_frame_fade.setEndValue(0.0)
+        self._frozen_frame_fade.finished.connect(self._clear_frozen_frame)
+
+        # Parent for the mosaic tiles, so one opacity change fades them all.
+        self.tile_layer = self._create_pixmap_layer(5)
+        self.tile_layer.setVisible(False)
+
+        # Let Qt keep the rasterized pixmaps so opacity-only frames, such as a
+        # crossfade, blit cached device pixels instead of resampling the source
+        # on every repaint; Ken Burns motion turns this off while it runs.
+        self.pixmap_item.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        self.next_pixmap_item.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        self.pixmap_item.setTransformationMode(Qt.TransformationMode.SmoothTransformation)
+        self.next_pixmap_item.setTransformationMode(Qt.TransformationMode.SmoothTransformation)
+
+        # Render through OpenGL so transitions and Ken Burns motion are drawn
+        # as textured quads on the GPU, unless no GL context can be created.
+        # Either way the whole viewport is repainted on every update; nothing
+        # else schedules repaints of the regions items leave behind.
+        if _opengl_available():
+            self.setViewport(QOpenGLWidget())
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        # Every item sets up its own pen, brush and hints, and none of them
+        # draws anti-aliased edges, so skip the per-item painter bookkeeping.
+        self.setOptimizationFlags(
+            QGraphicsView.OptimizationFlag.DontSavePainterState
+            | QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing
+        )
+        self.setCacheMode(QGraphicsView.CacheModeFlag.CacheBackground)
         self.setRenderHints(self.renderHints() | QPainter.RenderHint.SmoothPixmapTransform)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
@@ -113,49 +352,97 @@ class ImageViewer(QGraphicsView):
         self.setResizeAnchor(QGraphicsView.ViewportAnchor.AnchorViewCenter)
         self.setTransformationAnchor(QGraphicsView.ViewportAnchor.AnchorViewCenter)
 
+        # Viewport size, refreshed on resize, for the overlay layout code.
+        self._vp_w = self.viewport().width()
+        self._vp_h = self.viewport().height()
+        # View-space rect of the current image, cached until the view
+        # transform or the image changes.
+        self._displayed_rect = None
+        self._resize_debounce = QTimer(self)
+        self._resize_debounce.setSingleShot(True)
+        self._resize_debounce.setInterval(RESIZE_DEBOUNCE_MS)
+        self._resize_debounce.timeout.connect(self._do_refit)
+
+        # Starts motion on the next event loop pass, once the new image has
+        # been laid out; kept as an object so a newer image can cancel it.
         self.motion_timer = QTimer(self)
         self.motion_timer.setSingleShot(True)
+        self.motion_timer.setInterval(0)
         self.motion_timer.timeout.connect(self.start_motion)
 
-        self.motion_anim = QVariantAnimation(self)
-        self.motion_anim.setEasingCurve(QEasingCurve.Type.Linear)
-        self.motion_anim.valueChanged.connect(self.apply_motion_progress)
-
+        # Ken Burns motion zooms and pans the current layer through its Qt
+        # properties, so no Python runs on the individual animation frames.
+        self.motion_anim = QParallelAnimationGroup(self)
+        self._motion_scale_anim = QPropertyAnimation(self.pixmap_layer, b"scale", self)
+        self._motion_pos_anim = QPropertyAnimation(self.pixmap_layer, b"pos", self)
+        for animation in (self._motion_scale_anim, self._motion_pos_anim):
+            animation.setEasingCurve(QEasingCurve.Type.Linear)
+            self.motion_anim.addAnimation(animation)
+        self.motion_anim.stateChanged.connect(self._on_motion_state_changed)
+
+        # Drives the mosaic and pixelate transitions, which need per-frame
+        # Python logic; the other modes use the property animation groups.
         self.transition_anim = QVariantAnimation(self)
         self.transition_anim.setEasingCurve(QEasingCurve.Type.InOutCubic)
-        self.transition_anim.valueChanged.connect(self._apply_transition_progress)
+        self.transition_anim.valueChanged.connect(self._queue_transition_progress)
         self.transition_anim.finished.connect(self._finish_transition)
+        self._anim_groups = {}
+        self._active_transition_anim = None
 
         self.motion_duration = 5000  # default duration (ms), can be overridden per image
         self._current_pixmap = QPixmap()
-        self.base_transform = QTransform()
+        self._current_image_path = None
         self.start_scale = 1.0
         self.end_scale = 1.0
         self.total_dx = 0.0
         self.total_dy = 0.0
         self.motion_prepared = False
+        # Motion chosen for the incoming image while a transition runs.
+        self._planned_motion = None
 
         # Track the currently running transition, if any.
         self.transition_active = False
         self.transition_type = None
         self.transition_data = {}
         self.transition_tiles = []
+        # Per-tile mosaic state kept as parallel lists of plain floats so the
+        # frame loop avoids QPointF accessor calls.
+        self._tile_xs = []
+        self._tile_ys = []
+        self._tile_dxs = []
+        self._tile_dys = []
         self.incoming_pixmap = QPixmap()
-        self.available_transitions = list(SUPPORTED_TRANSITIONS)
+        self._progress_pending = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(TRANSITION_FRAME_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self._flush_transition_progress)
+        self.available_transitions = tuple(SUPPORTED_TRANSITIONS)
+        self._transition_fns = {
+            "mosaic": self._apply_mosaic,
+            "pixelate": self._apply_pixelate,
+        }
+        # Frame handler for the running transition, looked up once at start.
+        self._active_transition_fn = None
 
         self.metadata_label = QLabel(self)
         self.metadata_label.setAlignment(
             Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignBottom
         )
-        self.metadata_label.setStyleSheet(
-            "color: white; background-color: rgba(0, 0, 0, 180);"
-            "padding: 6px 14px; border-radius: 12px;"
-        )
+        # The rounded background is painted into the caption pixmap, so the
+        # label itself draws nothing but that pixmap.
+        self.metadata_label.setStyleSheet("background: transparent;")
         self.metadata_label.setWordWrap(False)
         self.metadata_label.setVisible(False)
         self.metadata_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
-        self.metadata_label.setTextFormat(Qt.TextFormat.RichText)
-        self.metadata_horizontal_padding = 28  # matches padding: 6px 14px
+        self.metadata_horizontal_padding = 28  # 14px on each side
+        self.metadata_vertical_padding = 12  # 6px above and below
+        self.metadata_corner_radius = 12
+        # Fonts and metrics used to render the metadata, keyed by
+        # (point size, weight).
+        self._metadata_font_cache = {}
+        self._metadata_elide_cache = {}
+        self._metadata_render_key = None
 
         self.weather_container = QWidget(self)
         self.weather_container.setAttribute(
@@ -267,9 +554,15 @@ class ImageViewer(QGraphicsView):
         )
         self.weather_layout.addWidget(self.weather_updated_label)
 
+        self._weather_style_key = None
         self._apply_weather_stylesheet()
 
         self.overlay_margin = 20
+        self._overlay_timer = QTimer(self)
+        self._overlay_timer.setSingleShot(True)
+        self._overlay_timer.setInterval(0)
+        self._overlay_timer.timeout.connect(self._flush_overlay_layout)
+        self._last_overlay_state = None
 
         self._photo_folder_text = ""
         self._photo_date_text = ""
@@ -277,20 +570,49 @@ class ImageViewer(QGraphicsView):
         self._weather_icon_key = None
         self._weather_icon_pixmap = QPixmap()
         self._weather_icon_size = 0
+        self._weather_render_key = None
         self._icon_cache = {}
+        self._icon_scaled_cache = {}
         self._pending_icon_reply = None
 
         self._update_weather_icon_size()
         self._pending_icon_key = None
         self._network_manager = QNetworkAccessManager(self)
 
+        # Single background decoder used to prefetch the next slideshow image.
+        # Decoded images land in a small LRU cache shared with that thread.
+        self._decode_pool = QThreadPool(self)
+        self._decode_pool.setMaxThreadCount(1)
+        self._preload_mutex = QMutex()
+        self._image_cache = OrderedDict()
+        self._image_cache_bytes = 0
+        # GUI-thread only; skips the QImage conversion and prescale on revisit.
+        self._pixmap_cache = OrderedDict()
+
+        # Reads EXIF dates for upcoming images so set_image finds them cached.
+        self._metadata_pool = QThreadPool(self)
+        self._metadata_pool.setMaxThreadCount(1)
+
+        # set_image decodes asynchronously; only the newest request is shown.
+        self._load_signals = _LoadSignals(self)
+        self._load_signals.loaded.connect(self._on_image_loaded)
+        self._load_signals.refreshed.connect(self._on_image_refreshed)
+        # Decode target the cached images were made for; see resizeEvent.
+        self._decode_target = self._decode_target_size()
+        self._load_serial = 0
+        self._pending_load = None
+
     def show_black_screen(self):
+        self._load_serial += 1
+        self._pending_load = None
         self.motion_timer.stop()
         self.motion_anim.stop()
         self.transition_anim.stop()
         self._reset_transition_items()
+        self._clear_frozen_frame()
 
         self._current_pixmap = QPixmap()
+        self._current_image_path = None
         empty_pixmap = QPixmap()
         self.pixmap_item.setPixmap(empty_pixmap)
         self.next_pixmap_item.setPixmap(empty_pixmap)
@@ -304,22 +626,209 @@ class ImageViewer(QGraphicsView):
         self._update_weather_display()
 
         self.scene.setSceneRect(QRectF(self.viewport().rect()))
-        self.viewport().update()
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        if not self._current_pixmap.isNull():
+        # Anything fitted before the debounce fires must see the new size.
+        self._vp_w = self.viewport().width()
+        self._vp_h = self.viewport().height()
+        self._resize_debounce.start()
+
+    def _do_refit(self):
+        self._displayed_rect = None
+        # _fit_pixmap relies on the scene rect matching the pixmap, which does
+        # not hold mid-transition; _finish_transition refits once it is done.
+        if not self._current_pixmap.isNull() and not self.transition_active:
             self._fit_pixmap()
         self._update_metadata_label()
-        self._update_overlay_positions()
+        self._recompute_overlay_layout()
+
+        # Images are decoded for the viewport size at the time; when the view
+        # grows (typically going full screen) they would be upscaled, so drop
+        # the cached decodes and fetch a sharper copy of the current image.
+        target = self._decode_target_size()
+        if (
+            target.width() > self._decode_target.width()
+            or target.height() > self._decode_target.height()
+        ):
+            previous = self._decode_target
+            self._decode_target = target
+            self._clear_image_cache()
+            # Only images that were capped at the old target can get sharper.
+            current = self._current_pixmap
+            if not current.isNull() and (
+                current.width() >= previous.width() - 1
+                or current.height() >= previous.height() - 1
+            ):
+                self._refresh_current_image()
+
+    def preload(self, image_path):
+        """Decode ``image_path`` in the background so a later ``set_image``
+        call for the same path can skip disk I/O and decoding."""
+        if not image_path:
+            return
+        self._preload_mutex.lock()
+        try:
+            cached = image_path in self._image_cache
+        finally:
+            self._preload_mutex.unlock()
+        if cached:
+            return
+        self._decode_pool.start(
+            _DecodeTask(image_path, self._decode_target_size(), self._store_preloaded)
+        )
+
+    def prefetch_metadata(self, image_paths):
+        """Read the photo dates of ``image_paths`` in the background."""
+        image_paths = [path for path in image_paths if path]
+        if image_paths:
+            self._metadata_pool.start(_MetadataTask(image_paths))
+
+    def _clear_image_cache(self):
+        self._preload_mutex.lock()
+        try:
+            self._image_cache.clear()
+            self._image_cache_bytes = 0
+        finally:
+            self._preload_mutex.unlock()
+        self._pixmap_cache.clear()
+
+    def _refresh_current_image(self):
+        if not self._current_image_path:
+            return
+        self._decode_pool.start(
+            _DecodeTask(
+                self._current_image_path,
+                self._decode_target_size(),
+                self._on_refresh_decoded,
+            )
+        )
+
+    def _on_refresh_decoded(self, image_path, image):
+        # Runs on the decode thread.
+        self._store_preloaded(image_path, image)
+        self._load_signals.refreshed.emit(image_path, image)
+
+    def _on_image_refreshed(self, image_path, image):
+        if image.isNull() or image_path != self._current_image_path:
+            return
+        if self.transition_active or self._pending_load is not None:
+            return
+        pixmap = self._prescale_pixmap(QPixmap.fromImage(image))
+        self._remember_pixmap(image_path, pixmap)
+        self._swap_current_pixmap(pixmap)
+
+    def _swap_current_pixmap(self, pixmap):
+        """Show a sharper copy of the current image without disturbing the
+        Ken Burns motion that is already running on it."""
+        old_rect = self.pixmap_item.boundingRect()
+        self._current_pixmap = pixmap
+        self.pixmap_item.setPixmap(pixmap)
+        self.scene.setSceneRect(QRectF(pixmap.rect()))
+        self._fit_pixmap()
+        self._update_metadata_label()
+        self._recompute_overlay_layout()
+        if old_rect.isEmpty():
+            return
+
+        # Motion offsets are in pixmap pixels; rescale them so the image keeps
+        # the same path across the screen. Scales are relative and carry over.
+        ratio_x = pixmap.width() / old_rect.width()
+        ratio_y = pixmap.height() / old_rect.height()
+        self.total_dx *= ratio_x
+        self.total_dy *= ratio_y
+        layer = self.pixmap_layer
+        layer.setTransformOriginPoint(self.pixmap_item.boundingRect().center())
+        layer.setPos(layer.pos().x() * ratio_x, layer.pos().y() * ratio_y)
+        # A running animation picks the new end point up on its next frame.
+        self._motion_pos_anim.setEndValue(QPointF(self.total_dx, self.total_dy))
+
+    def _remember_pixmap(self, image_path, pixmap):
+        self._pixmap_cache[image_path] = pixmap
+        self._pixmap_cache.move_to_end(image_path)
+        while len(self._pixmap_cache) > PIXMAP_CACHE_MAX_ENTRIES:
+            self._pixmap_cache.popitem(last=False)
+
+    def _store_preloaded(self, image_path, image):
+        if image.isNull():
+            return
+        self._preload_mutex.lock()
+        try:
+            cache = self._image_cache
+            previous = cache.pop(image_path, None)
+            if previous is not None:
+                self._image_cache_bytes -= previous.sizeInBytes()
+            cache[image_path] = image
+            self._image_cache_bytes += image.sizeInBytes()
+            while len(cache) > 1 and (
+                len(cache) > IMAGE_CACHE_MAX_ENTRIES
+                or self._image_cache_bytes > IMAGE_CACHE_MAX_BYTES
+            ):
+                _, evicted = cache.popitem(last=False)
+                self._image_cache_bytes -= evicted.sizeInBytes()
+        finally:
+            self._preload_mutex.unlock()
+
+    def _take_preloaded(self, image_path):
+        pixmap = self._pixmap_cache.get(image_path)
+        if pixmap is not None:
+            self._pixmap_cache.move_to_end(image_path)
+            return pixmap
+        self._preload_mutex.lock()
+        try:
+            image = self._image_cache.get(image_path)
+            if image is None:
+                return None
+            self._image_cache.move_to_end(image_path)
+        finally:
+            self._preload_mutex.unlock()
+        return QPixmap.fromImage(image)
 
     def set_image(self, image_path, duration=None, transition=None):
-        pixmap = QPixmap(image_path)
+        # A newer request always supersedes a load that is still in flight.
+        self._load_serial += 1
+        serial = self._load_serial
+        self._pending_load = None
+
+        pixmap = self._take_preloaded(image_path)
+        if pixmap is not None:
+            self._show_image(image_path, pixmap, duration, transition)
+            return
+
+        # Decode on the worker thread so the GUI thread, and any running
+        # animation, never blocks on disk I/O or JPEG decoding.
+        self._pending_load = (duration, transition)
+        self._decode_pool.start(
+            _DecodeTask(
+                image_path,
+                self._decode_target_size(),
+                lambda path, image: self._on_decoded(serial, path, image),
+            ),
+            1,
+        )
+
+    def _on_decoded(self, serial, image_path, image):
+        # Runs on the decode thread.
+        self._store_preloaded(image_path, image)
+        self._load_signals.loaded.emit(serial, image_path, image)
+
+    def _on_image_loaded(self, serial, image_path, image):
+        if serial != self._load_serial or self._pending_load is None:
+            return
+        duration, transition = self._pending_load
+        self._pending_load = None
+        pixmap = QPixmap.fromImage(image) if not image.isNull() else QPixmap()
+        self._show_image(image_path, pixmap, duration, transition)
+
+    def _show_image(self, image_path, pixmap, duration, transition):
         if pixmap.isNull():
             self._photo_folder_text = ""
             self._photo_date_text = ""
             self._update_metadata_label()
             return
+        pixmap = self._prescale_pixmap(pixmap)
+        self._current_image_path = image_path
+        self._remember_pixmap(image_path, pixmap)
 
         self.motion_timer.stop()
         self.motion_anim.stop()
@@ -330,7 +839,7 @@ class ImageViewer(QGraphicsView):
 
         self._set_photo_metadata(image_path)
         self._update_metadata_label()
-        self._update_overlay_positions()
+        self._recompute_overlay_layout()
 
         requested_transition = None
         if isinstance(transition, str):
@@ -343,8 +852,12 @@ class ImageViewer(QGraphicsView):
             return
 
         if self.transition_active:
+            # Freeze what is on screen right now, mid-transition, and fade it
+            # out over the new image rather than cutting straight to it.
+            frame = self.viewport().grab()
             self._reset_transition_items()
             self._apply_pixmap_immediately(pixmap)
+            self._fade_out_frame(frame)
             return
 
         if requested_transition is None:
@@ -356,22 +869,43 @@ class ImageViewer(QGraphicsView):
         self.incoming_pixmap = pixmap
         self._start_transition(requested_transition)
 
+    def _decode_target_size(self):
+        """Largest image size worth decoding: the physical viewport plus
+        headroom for the Ken Burns and zoom transition scale-ups."""
+        return self.viewport().size() * (self.devicePixelRatioF() * PRESCALE_HEADROOM)
+
+    def _prescale_pixmap(self, pixmap):
+        """Downscale ``pixmap`` to the decode target so the extra pixels of
+        large photos are not resampled on every frame."""
+        target = self._decode_target_size()
+        if target.isEmpty():
+            return pixmap
+        if pixmap.width() <= target.width() and pixmap.height() <= target.height():
+            return pixmap
+        return pixmap.scaled(
+            target,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+
     def set_available_transitions(self, transitions):
         if transitions is None:
-            self.available_transitions = list(SUPPORTED_TRANSITIONS)
+            self.available_transitions = tuple(SUPPORTED_TRANSITIONS)
             return
 
         if isinstance(transitions, str):
             transitions = [transitions]
 
         filtered = []
+        seen = set()
         for transition in transitions:
             if not isinstance(transition, str):
                 continue
             trimmed = transition.strip().lower()
-            if trimmed in SUPPORTED_TRANSITIONS_SET and trimmed not in filtered:
+            if trimmed in SUPPORTED_TRANSITIONS_SET and trimmed not in seen:
+                seen.add(trimmed)
                 filtered.append(trimmed)
-        self.available_transitions = filtered
+        self.available_transitions = tuple(filtered)
 
     def _apply_pixmap_immediately(self, pixmap):
         self._reset_transition_items()
@@ -380,17 +914,44 @@ class ImageViewer(QGraphicsView):
         self.pixmap_item.setPixmap(pixmap)
 
         self.scene.setSceneRect(QRectF(pixmap.rect()))
-        self.resetTransform()
         self._fit_pixmap()
-        self._update_overlay_positions()
+        self._recompute_overlay_layout()
 
         if self.motion_enabled:
             self._prepare_motion_parameters()
             if self.motion_duration > 0:
-                self.motion_timer.start(50)
+                self.motion_timer.start()
         else:
             self.motion_prepared = False
 
+    def _fade_out_frame(self, frame):
+        if frame.isNull():
+            return
+        # Cover the whole viewport in the scene coordinates of the new fit.
+        visible = self.mapToScene(self.viewport().rect()).boundingRect()
+        size = frame.deviceIndependentSize()
+        self.frozen_frame_item.setPixmap(frame)
+        self.frozen_frame_item.setTransform(
+            QTransform.fromScale(visible.width() / size.width(), visible.height() / size.height())
+        )
+        self.frozen_frame_layer.setPos(visible.topLeft())
+        self.frozen_frame_layer.setOpacity(1.0)
+        self.frozen_frame_layer.setVisible(True)
+        self._frozen_frame_fade.stop()
+        self._frozen_frame_fade.start()
+
+    def _clear_frozen_frame(self):
+        self._frozen_frame_fade.stop()
+        self.frozen_frame_layer.setVisible(False)
+        self.frozen_frame_item.setPixmap(QPixmap())
+
+    def _create_pixmap_layer(self, z_value):
+        layer = QGraphicsWidget()
+        layer.setFlag(QGraphicsItem.GraphicsItemFlag.ItemHasNoContents)
+        layer.setZValue(z_value)
+        self.scene.addItem(layer)
+        return layer
+
     def _start_transition(self, transition_type):
         self.transition_active = True
         if transition_type not in SUPPORTED_TRANSITIONS_SET:
@@ -402,71 +963,156 @@ class ImageViewer(QGraphicsView):
         new_pixmap = self.incoming_pixmap
         self.scene.setSceneRect(self._combined_scene_rect(old_pixmap, new_pixmap))
 
-        self.pixmap_item.setPos(0, 0)
-        self.pixmap_item.setScale(1.0)
-        self.pixmap_item.setRotation(0.0)
-        self.pixmap_item.setOpacity(1.0)
-        self.pixmap_item.setTransformOriginPoint(self.pixmap_item.boundingRect().center())
+        current = self.pixmap_layer
+        incoming = self.next_pixmap_layer
+        # Carry on from wherever Ken Burns motion left the outgoing image, and
+        # land the incoming one on the first frame of its own motion, so
+        # neither jumps when the transition starts or hands over.
+        out_scale = current.scale()
+        out_pos = current.pos()
+        self._reset_layer(current)
+        current.setTransformOriginPoint(self.pixmap_item.boundingRect().center())
+        current.setScale(out_scale)
+        current.setPos(out_pos)
 
         self.next_pixmap_item.setPixmap(new_pixmap)
-        self.next_pixmap_item.setVisible(True)
-        self.next_pixmap_item.setOpacity(1.0)
-        self.next_pixmap_item.setPos(0, 0)
-        self.next_pixmap_item.setScale(1.0)
-        self.next_pixmap_item.setRotation(0.0)
-        self.next_pixmap_item.setTransformOriginPoint(self.next_pixmap_item.boundingRect().center())
-
-        if self.transition_type == "crossfade":
-            self.pixmap_item.setOpacity(1.0)
-            self.next_pixmap_item.setOpacity(0.0)
-            self.transition_anim.setDuration(700)
-        elif self.transition_type == "slide-horizontal":
+        self._reset_layer(incoming)
+        incoming.setVisible(True)
+        incoming.setTransformOriginPoint(self.next_pixmap_item.boundingRect().center())
+        in_scale = self._plan_incoming_motion(self.next_pixmap_item.boundingRect())
+        incoming.setScale(in_scale)
+
+        origin = QPointF(0, 0)
+        if self.transition_type == "slide-horizontal":
             direction = random.choice([-1, 1])
             distance = max(old_pixmap.width(), new_pixmap.width())
-            self.next_pixmap_item.setPos(direction * distance, 0)
-            self.transition_data = {"direction": direction, "distance": distance}
-            self.transition_anim.setDuration(650)
+            self._active_transition_anim = self._property_transition(
+                self.transition_type,
+                650,
+                [
+                    (incoming, b"pos", QPointF(direction * distance, 0), origin),
+                    (current, b"pos", out_pos, out_pos + QPointF(-direction * distance, 0)),
+                ],
+            )
         elif self.transition_type == "slide-vertical":
             direction = random.choice([-1, 1])
             distance = max(old_pixmap.height(), new_pixmap.height())
-            self.next_pixmap_item.setPos(0, direction * distance)
-            self.transition_data = {"direction": direction, "distance": distance}
-            self.transition_anim.setDuration(650)
+            self._active_transition_anim = self._property_transition(
+                self.transition_type,
+                650,
+                [
+                    (incoming, b"pos", QPointF(0, direction * distance), origin),
+                    (current, b"pos", out_pos, out_pos + QPointF(0, -direction * distance)),
+                ],
+            )
         elif self.transition_type == "zoom":
             zoom_in = random.choice([True, False])
-            start_scale = 0.7 if zoom_in else 1.2
-            self.next_pixmap_item.setScale(start_scale)
-            self.next_pixmap_item.setOpacity(0.0)
-            self.transition_data = {"start_scale": start_scale, "end_scale": 1.0}
-            self.transition_anim.setDuration(750)
+            # The incoming image may already sit zoomed in for its motion;
+            # starting beyond the decode headroom would upscale the pixels.
+            start_scale = min((0.7 if zoom_in else 1.2) * in_scale, PRESCALE_HEADROOM)
+            self._active_transition_anim = self._property_transition(
+                self.transition_type,
+                750,
+                [
+                    (incoming, b"scale", start_scale, in_scale),
+                    (incoming, b"opacity", 0.0, 1.0),
+                    (current, b"opacity", 1.0, 0.0),
+                ],
+            )
         elif self.transition_type == "carousel":
             width = max(old_pixmap.width(), new_pixmap.width())
-            self.pixmap_item.setTransformOriginPoint(self.pixmap_item.boundingRect().center())
-            self.next_pixmap_item.setTransformOriginPoint(self.next_pixmap_item.boundingRect().center())
-            self.next_pixmap_item.setScale(0.8)
-            self.next_pixmap_item.setOpacity(0.2)
-            self.next_pixmap_item.setPos(width * 0.55, 0)
-            self.transition_data = {"width": width}
-            self.transition_anim.setDuration(800)
+            self._active_transition_anim = self._property_transition(
+                self.transition_type,
+                800,
+                [
+                    (current, b"pos", out_pos, out_pos + QPointF(-width * 0.35, 0)),
+                    (current, b"opacity", 1.0, 0.3),
+                    (current, b"scale", out_scale, out_scale * 0.8),
+                    (current, b"rotation", 0.0, -18.0),
+                    (incoming, b"pos", QPointF(width * 0.45, 0), QPointF(-width * 0.1, 0)),
+                    (incoming, b"opacity", 0.2, 1.0),
+                    (incoming, b"scale", 0.8 * in_scale, in_scale),
+                    (incoming, b"rotation", 12.0, 0.0),
+                ],
+            )
         elif self.transition_type == "mosaic":
             self._create_mosaic_tiles(old_pixmap)
-            self.pixmap_item.setOpacity(0.0)
-            self.next_pixmap_item.setOpacity(0.0)
-            self.next_pixmap_item.setZValue(-1)
+            self.tile_layer.setTransformOriginPoint(current.transformOriginPoint())
+            self.tile_layer.setScale(out_scale)
+            self.tile_layer.setPos(out_pos)
+            current.setOpacity(0.0)
+            incoming.setOpacity(0.0)
+            incoming.setZValue(-1)
             self.transition_anim.setDuration(900)
+            self._active_transition_anim = self.transition_anim
         elif self.transition_type == "pixelate":
-            self.next_pixmap_item.setOpacity(1.0)
+            self.transition_data = {"levels": self._build_pixelate_levels(new_pixmap)}
+            # Nearest-neighbour stretching is what makes the levels blocky.
+            self.next_pixmap_item.setTransformationMode(Qt.TransformationMode.FastTransformation)
             self.transition_anim.setDuration(650)
+            self._active_transition_anim = self.transition_anim
         else:
+            # Crossfade, which also serves as the fallback.
             self.transition_type = "crossfade"
-            self.pixmap_item.setOpacity(1.0)
-            self.next_pixmap_item.setOpacity(0.0)
-            self.transition_anim.setDuration(700)
+            if self._incoming_covers_current(old_pixmap):
+                # Fading the incoming image in over the opaque outgoing one
+                # gives the same blend with a single translucent layer, and
+                # the outgoing layer keeps its cached rendering throughout.
+                self._active_transition_anim = self._property_transition(
+                    "crossfade-over",
+                    700,
+                    [(incoming, b"opacity", 0.0, 1.0)],
+                )
+            else:
+                self._active_transition_anim = self._property_transition(
+                    self.transition_type,
+                    700,
+                    [
+                        (incoming, b"opacity", 0.0, 1.0),
+                        (current, b"opacity", 1.0, 0.0),
+                    ],
+                )
 
-        self.transition_anim.setStartValue(0.0)
-        self.transition_anim.setEndValue(1.0)
-        self._apply_transition_progress(0.0)
-        self.transition_anim.start()
+        self._active_transition_fn = self._transition_fns.get(self.transition_type)
+        if self._active_transition_anim is self.transition_anim:
+            self.transition_anim.setStartValue(0.0)
+            self.transition_anim.setEndValue(1.0)
+            self._progress_pending = None
+            self._apply_transition_progress(0.0)
+        self._active_transition_anim.start()
+
+    def _incoming_covers_current(self, old_pixmap):
+        """Whether the incoming image hides every pixel of the outgoing one
+        once fully opaque, so the outgoing layer need not fade out."""
+        if old_pixmap.hasAlphaChannel() or self.incoming_pixmap.hasAlphaChannel():
+            return False
+        incoming_rect = self.next_pixmap_item.sceneBoundingRect()
+        return incoming_rect.contains(self.pixmap_item.sceneBoundingRect())
+
+    def _property_transition(self, transition_type, duration, targets):
+        """Return the cached animation group for ``transition_type`` with its
+        endpoints updated from ``targets`` (layer, property, start, end)."""
+        entry = self._anim_groups.get(transition_type)
+        if entry is None:
+            group = QParallelAnimationGroup(self)
+            animations = []
+            for layer, property_name, _, _ in targets:
+                animation = QPropertyAnimation(layer, property_name, group)
+                animation.setEasingCurve(QEasingCurve.Type.InOutCubic)
+                group.addAnimation(animation)
+                animations.append(animation)
+            group.finished.connect(self._finish_transition)
+            entry = (group, animations)
+            self._anim_groups[transition_type] = entry
+
+        group, animations = entry
+        for animation, (layer, property_name, start, end) in zip(animations, targets):
+            animation.setDuration(duration)
+            animation.setStartValue(start)
+            animation.setEndValue(end)
+            # Show the starting state before the first animation frame.
+            layer.setProperty(property_name.decode(), start)
+        return group
 
     def _choose_transition(self):
         if not self.available_transitions:
@@ -482,93 +1128,66 @@ class ImageViewer(QGraphicsView):
         height = max(heights)
         return QRectF(0, 0, width, height)
 
+    def _queue_transition_progress(self, progress):
+        # Coalesce animation ticks so the scene is updated at most once per
+        # frame interval, whatever rate the animation driver runs at.
+        self._progress_pending = progress
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _flush_transition_progress(self):
+        progress = self._progress_pending
+        self._progress_pending = None
+        if progress is not None:
+            self._apply_transition_progress(progress)
+
     def _apply_transition_progress(self, progress):
         if not self.transition_active:
             return
 
         progress = max(0.0, min(1.0, float(progress)))
 
-        if self.transition_type == "crossfade":
-            self.next_pixmap_item.setOpacity(progress)
-            self.pixmap_item.setOpacity(1.0 - progress)
-        elif self.transition_type == "slide-horizontal":
-            direction = self.transition_data.get("direction", 1)
-            distance = self.transition_data.get("distance", 0)
-            self.next_pixmap_item.setPos(direction * (1.0 - progress) * distance, 0)
-            self.pixmap_item.setPos(-direction * progress * distance, 0)
-        elif self.transition_type == "slide-vertical":
-            direction = self.transition_data.get("direction", 1)
-            distance = self.transition_data.get("distance", 0)
-            self.next_pixmap_item.setPos(0, direction * (1.0 - progress) * distance)
-            self.pixmap_item.setPos(0, -direction * progress * distance)
-        elif self.transition_type == "zoom":
-            start_scale = self.transition_data.get("start_scale", 0.7)
-            end_scale = self.transition_data.get("end_scale", 1.0)
-            current_scale = start_scale + (end_scale - start_scale) * progress
-            self.next_pixmap_item.setScale(current_scale)
-            self.next_pixmap_item.setOpacity(progress)
-            self.pixmap_item.setOpacity(1.0 - progress)
-        elif self.transition_type == "carousel":
-            width = self.transition_data.get("width", 0)
-            self.pixmap_item.setPos(-width * 0.35 * progress, 0)
-            self.pixmap_item.setOpacity(1.0 - 0.7 * progress)
-            self.pixmap_item.setScale(1.0 - 0.2 * progress)
-            self.pixmap_item.setRotation(-18 * progress)
-
-            self.next_pixmap_item.setPos(width * 0.55 * (1.0 - progress) - width * 0.1, 0)
-            self.next_pixmap_item.setOpacity(0.2 + 0.8 * progress)
-            self.next_pixmap_item.setScale(0.8 + 0.2 * progress)
-            self.next_pixmap_item.setRotation(12 * (1.0 - progress))
-        elif self.transition_type == "mosaic":
-            for tile, origin, offset in self.transition_tiles:
-                current_x = origin.x() + offset.x() * progress
-                current_y = origin.y() + offset.y() * progress
-                tile.setPos(current_x, current_y)
-                tile.setOpacity(1.0 - progress)
-            self.next_pixmap_item.setOpacity(progress)
-        elif self.transition_type == "pixelate":
-            self.pixmap_item.setOpacity(1.0 - progress)
-            self.next_pixmap_item.setOpacity(1.0)
-            self._update_pixelated_pixmap(progress)
+        if self._active_transition_fn is not None:
+            self._active_transition_fn(progress)
+
+    def _apply_mosaic(self, progress):
+        for tile, x, y, dx, dy in zip(
+            self.transition_tiles,
+            self._tile_xs,
+            self._tile_ys,
+            self._tile_dxs,
+            self._tile_dys,
+        ):
+            tile.setPos(x + dx * progress, y + dy * progress)
+        self.tile_layer.setOpacity(1.0 - progress)
+        self.next_pixmap_layer.setOpacity(progress)
 
-        self._update_overlay_positions()
+    def _apply_pixelate(self, progress):
+        self.pixmap_layer.setOpacity(1.0 - progress)
+        self._update_pixelated_pixmap(progress)
 
     def _finish_transition(self):
         if not self.transition_active:
             return
 
-        self.transition_anim.stop()
+        self._stop_transition_animations()
 
         if self.transition_type == "pixelate" and not self.incoming_pixmap.isNull():
             self.next_pixmap_item.setPixmap(self.incoming_pixmap)
 
-        self._cleanup_transition_tiles()
-
-        self.pixmap_item.setOpacity(1.0)
-        self.pixmap_item.setPos(0, 0)
-        self.pixmap_item.setScale(1.0)
-        self.pixmap_item.setRotation(0.0)
-        self.pixmap_item.setTransformOriginPoint(QPointF(0, 0))
-
-        self.next_pixmap_item.setVisible(False)
-        self.next_pixmap_item.setOpacity(1.0)
-        self.next_pixmap_item.setPos(0, 0)
-        self.next_pixmap_item.setScale(1.0)
-        self.next_pixmap_item.setRotation(0.0)
-        self.next_pixmap_item.setZValue(1)
+        self._restore_transition_items()
 
         if not self.incoming_pixmap.isNull():
             self._current_pixmap = self.incoming_pixmap
             self.pixmap_item.setPixmap(self.incoming_pixmap)
             self.scene.setSceneRect(QRectF(self.incoming_pixmap.rect()))
-            self.resetTransform()
             self._fit_pixmap()
-            self._update_overlay_positions()
+            self._recompute_overlay_layout()
 
             if self.motion_enabled:
                 self._prepare_motion_parameters()
                 if self.motion_duration > 0:
-                    self.motion_timer.start(50)
+                    self.motion_timer.start()
             else:
                 self.motion_prepared = False
 
@@ -578,32 +1197,54 @@ class ImageViewer(QGraphicsView):
         self.incoming_pixmap = QPixmap()
 
     def _reset_transition_items(self):
-        self.transition_anim.stop()
-        self._cleanup_transition_tiles()
-
-        self.pixmap_item.setOpacity(1.0)
-        self.pixmap_item.setPos(0, 0)
-        self.pixmap_item.setScale(1.0)
-        self.pixmap_item.setRotation(0.0)
-        self.pixmap_item.setTransformOriginPoint(QPointF(0, 0))
-
-        self.next_pixmap_item.setVisible(False)
-        self.next_pixmap_item.setOpacity(1.0)
-        self.next_pixmap_item.setPos(0, 0)
-        self.next_pixmap_item.setScale(1.0)
-        self.next_pixmap_item.setRotation(0.0)
-        self.next_pixmap_item.setTransformOriginPoint(QPointF(0, 0))
-        self.next_pixmap_item.setZValue(1)
+        self._stop_transition_animations()
+        self._restore_transition_items()
+        self._planned_motion = None
 
         self.transition_active = False
         self.transition_type = None
         self.transition_data = {}
         self.incoming_pixmap = QPixmap()
 
+    def _stop_transition_animations(self):
+        self._active_transition_fn = None
+        self.transition_anim.stop()
+        self._progress_timer.stop()
+        self._progress_pending = None
+        if self._active_transition_anim is not None:
+            self._active_transition_anim.stop()
+            self._active_transition_anim = None
+
+    def _restore_transition_items(self):
+        self._cleanup_transition_tiles()
+
+        self._reset_layer(self.pixmap_layer)
+        self.pixmap_layer.setZValue(0)
+
+        self._reset_layer(self.next_pixmap_layer)
+        self.next_pixmap_layer.setVisible(False)
+        self.next_pixmap_layer.setZValue(1)
+        self.next_pixmap_item.setTransform(QTransform())
+        self.next_pixmap_item.setTransformationMode(Qt.TransformationMode.SmoothTransformation)
+
+    @staticmethod
+    def _reset_layer(layer):
+        layer.setOpacity(1.0)
+        layer.setPos(0, 0)
+        layer.setScale(1.0)
+        layer.setRotation(0.0)
+        layer.setTransformOriginPoint(QPointF(0, 0))
+
     def _cleanup_transition_tiles(self):
-        for tile, _, _ in self.transition_tiles:
+        for tile in self.transition_tiles:
             self.scene.removeItem(tile)
         self.transition_tiles = []
+        self._tile_xs = []
+        self._tile_ys = []
+        self._tile_dxs = []
+        self._tile_dys = []
+        self.tile_layer.setVisible(False)
+        self._reset_layer(self.tile_layer)
 
     def _create_mosaic_tiles(self, old_pixmap):
         self._cleanup_transition_tiles()
@@ -615,56 +1256,83 @@ class ImageViewer(QGraphicsView):
         width = old_pixmap.width()
         height = old_pixmap.height()
 
+        # Compute the grid bounds and scatter offsets up front so the tile
+        # loop below only has to build the scene items.
+        xs = [col * width // cols for col in range(cols + 1)]
+        ys = [row * height // rows for row in range(rows + 1)]
+        for _ in range(cols * rows):
+            angle = random.uniform(0, 2 * math.pi)
+            distance = random.uniform(width * 0.2, width * 0.6)
+            self._tile_dxs.append(math.cos(angle) * distance)
+            self._tile_dys.append(math.sin(angle) * distance)
+
         for col in range(cols):
+            x = xs[col]
+            tile_width = max(1, xs[col + 1] - x)
             for row in range(rows):
-                x = int(col * width / cols)
-                y = int(row * height / rows)
-                next_x = int((col + 1) * width / cols)
-                next_y = int((row + 1) * height / rows)
-                tile_width = max(1, next_x - x)
-                tile_height = max(1, next_y - y)
-
-                tile_pixmap = old_pixmap.copy(x, y, tile_width, tile_height)
-                tile_item = QGraphicsPixmapItem(tile_pixmap)
+                y = ys[row]
+                tile_height = max(1, ys[row + 1] - y)
+
+                # Each tile is a clipping rect showing its slice of the shared
+                # source pixmap, so no pixel data is copied per tile.
+                tile_item = QGraphicsRectItem(0, 0, tile_width, tile_height, self.tile_layer)
+                tile_item.setPen(QPen(Qt.PenStyle.NoPen))
+                tile_item.setFlag(QGraphicsItem.GraphicsItemFlag.ItemClipsChildrenToShape)
                 tile_item.setPos(x, y)
-                tile_item.setZValue(5)
-                self.scene.addItem(tile_item)
+                tile_pixmap_item = QGraphicsPixmapItem(old_pixmap, tile_item)
+                tile_pixmap_item.setOffset(-x, -y)
 
-                angle = random.uniform(0, 2 * math.pi)
-                distance = random.uniform(width * 0.2, width * 0.6)
-                dx = math.cos(angle) * distance
-                dy = math.sin(angle) * distance
-                origin = QPointF(x, y)
-                offset = QPointF(dx, dy)
-                self.transition_tiles.append((tile_item, origin, offset))
+                self.transition_tiles.append(tile_item)
+                self._tile_xs.append(float(x))
+                self._tile_ys.append(float(y))
+
+        self.tile_layer.setVisible(True)
+
+    def _build_pixelate_levels(self, pixmap, min_size=16):
+        """Build a halving pyramid of ``pixmap``; level ``i`` is 1/2**i size."""
+        if pixmap.isNull():
+            return []
+
+        # Each level is derived from the previous one so only the first step
+        # reads the full-resolution image.
+        levels = [pixmap]
+        source = pixmap
+        while min(source.width(), source.height()) // 2 >= min_size:
+            source = source.scaled(
+                source.width() // 2,
+                source.height() // 2,
+                Qt.AspectRatioMode.IgnoreAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+            levels.append(source)
+        return levels
 
     def _update_pixelated_pixmap(self, progress):
-        if self.incoming_pixmap.isNull():
+        levels = self.transition_data["levels"]
+        if not levels:
             return
 
         progress = max(0.0, min(1.0, float(progress)))
-        width = max(1, self.incoming_pixmap.width())
-        height = max(1, self.incoming_pixmap.height())
-
         min_ratio = 0.05
         ratio = min_ratio + (1.0 - min_ratio) * progress
-        sample_width = max(1, int(width * ratio))
-        sample_height = max(1, int(height * ratio))
-
-        scaled_down = self.incoming_pixmap.scaled(
-            sample_width,
-            sample_height,
-            Qt.AspectRatioMode.IgnoreAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
-        )
-
-        pixelated = scaled_down.scaled(
-            width,
-            height,
-            Qt.AspectRatioMode.IgnoreAspectRatio,
-            Qt.TransformationMode.FastTransformation,
+        index = min(len(levels) - 1, int(math.log2(1.0 / ratio)))
+        # Most frames land on the same level as the previous one; the item
+        # already shows it, so there is nothing to upload or re-transform.
+        if index == self.transition_data.get("level_index"):
+            return
+        self.transition_data["level_index"] = index
+        level = levels[index]
+        self.next_pixmap_item.setPixmap(level)
+
+        # Stretch the small level back to full size with the item transform;
+        # the pixmap item samples nearest-neighbour during this transition,
+        # which keeps the blocky look without resampling on the CPU.
+        self.next_pixmap_item.setTransform(
+            QTransform.fromScale(
+                self.incoming_pixmap.width() / level.width(),
+                self.incoming_pixmap.height() / level.height(),
+            )
         )
-        self.next_pixmap_item.setPixmap(pixelated)
 
     def start_motion(self):
         if not self.motion_enabled or not self.motion_prepared:
@@ -674,33 +1342,76 @@ class ImageViewer(QGraphicsView):
             return
 
         self.motion_anim.stop()
-        self.motion_anim.setStartValue(0.0)
-        self.motion_anim.setEndValue(1.0)
-        self.motion_anim.setDuration(self.motion_duration)
-        self.apply_motion_progress(0.0)
+        self._motion_scale_anim.setStartValue(self.start_scale)
+        self._motion_scale_anim.setEndValue(self.end_scale)
+        self._motion_pos_anim.setStartValue(QPointF(0, 0))
+        self._motion_pos_anim.setEndValue(QPointF(self.total_dx, self.total_dy))
+        for animation in (self._motion_scale_anim, self._motion_pos_anim):
+            animation.setDuration(self.motion_duration)
+        # _prepare_motion_parameters already showed the first frame, and
+        # starting the animations writes their start values anyway.
         self.motion_anim.start()
 
+    def _on_motion_state_changed(self, new_state, _old_state):
+        # Every scale step would invalidate the device-coordinate cache, so
+        # drop it while moving and keep it for the still image. Sampling stays
+        # smooth: the prescaled pixmap is usually shown slightly minified with
+        # a sub-pixel pan, where nearest neighbour visibly shimmers.
+        if new_state == QAbstractAnimation.State.Running:
+            cache_mode = QGraphicsItem.CacheMode.NoCache
+        else:
+            cache_mode = QGraphicsItem.CacheMode.DeviceCoordinateCache
+        if self.pixmap_item.cacheMode() != cache_mode:
+            self.pixmap_item.setCacheMode(cache_mode)
+
     def apply_motion_progress(self, progress):
         progress = max(0.0, min(1.0, float(progress)))
 
         current_scale = self.start_scale + (self.end_scale - self.start_scale) * progress
-        current_dx = self.total_dx * progress
-        current_dy = self.total_dy * progress
-
-        transform = QTransform(self.base_transform)
-        transform.scale(current_scale, current_scale)
-        transform.translate(current_dx, current_dy)
-
-        self.setTransform(transform)
-        self._update_overlay_positions()
+        self.pixmap_layer.setScale(current_scale)
+        self.pixmap_layer.setPos(self.total_dx * progress, self.total_dy * progress)
 
     def _fit_pixmap(self):
         """Scale the current image so it fits the available viewport."""
         if self.pixmap_item.pixmap().isNull():
             return
 
-        self.fitInView(self.pixmap_item, Qt.AspectRatioMode.KeepAspectRatio)
-        self.base_transform = self.transform()
+        # Same scale fitInView would pick, including its 2px margin, without
+        # the scene mapping; the scene rect is the pixmap, so the view's
+        # centre alignment positions it. The layer may be mid-motion, so
+        # fit the untransformed pixmap.
+        pixmap = self.pixmap_item.pixmap()
+        scale = min(
+            max(1, self._vp_w - 4) / pixmap.width(),
+            max(1, self._vp_h - 4) / pixmap.height(),
+        )
+        transform = QTransform.fromScale(scale, scale)
+        self.setTransform(transform)
+        self._displayed_rect = None
+
+    @staticmethod
+    def _random_motion(pixmap_rect):
+        """Return (start_scale, end_scale, total_dx, total_dy) for a slide."""
+        zoom = random.uniform(1.08, 1.2)
+        if random.random() < 0.5:
+            start_scale, end_scale = 1.0, zoom
+        else:
+            start_scale, end_scale = zoom, 1.0
+
+        pan_ratio = random.uniform(0.02, 0.08)
+        unit_x, unit_y = random.choice(MOTION_PAN_DIRECTIONS)
+        total_dx = pixmap_rect.width() * pan_ratio * unit_x
+        total_dy = pixmap_rect.height() * pan_ratio * unit_y
+        return start_scale, end_scale, total_dx, total_dy
+
+    def _plan_incoming_motion(self, pixmap_rect):
+        """Pick the motion the incoming image will run after the transition
+        and return the scale its first frame starts at."""
+        self._planned_motion = None
+        if not self.motion_enabled or self.motion_duration <= 0:
+            return 1.0
+        self._planned_motion = self._random_motion(pixmap_rect)
+        return self._planned_motion[0]
 
     def _prepare_motion_parameters(self):
         pixmap = self.pixmap_item.pixmap()
@@ -708,20 +1419,11 @@ class ImageViewer(QGraphicsView):
             self.motion_prepared = False
             return
 
-        zoom_in = random.choice([True, False])
-        if zoom_in:
-            self.start_scale = 1.0
-            self.end_scale = random.uniform(1.08, 1.2)
-        else:
-            self.start_scale = random.uniform(1.08, 1.2)
-            self.end_scale = 1.0
-
-        pan_ratio = random.uniform(0.02, 0.08)
-        pan_angle = random.uniform(0, 2 * math.pi)
         pixmap_rect = self.pixmap_item.boundingRect()
-
-        self.total_dx = pixmap_rect.width() * pan_ratio * math.cos(pan_angle)
-        self.total_dy = pixmap_rect.height() * pan_ratio * math.sin(pan_angle)
+        motion = self._planned_motion or self._random_motion(pixmap_rect)
+        self._planned_motion = None
+        self.start_scale, self.end_scale, self.total_dx, self.total_dy = motion
+        self.pixmap_layer.setTransformOriginPoint(pixmap_rect.center())
         self.motion_prepared = True
 
         self.apply_motion_progress(0.0)
@@ -736,8 +1438,10 @@ class ImageViewer(QGraphicsView):
             return
         self.folder_font_size = sanitized_folder
         self.date_font_size = sanitized_date
+        self._metadata_font_cache.clear()
+        self._metadata_elide_cache.clear()
         self._update_metadata_label()
-        self._update_overlay_positions()
+        self._recompute_overlay_layout()
 
     def set_weather_font_size(self, font_size):
         sanitized = self._sanitize_font_size(font_size)
@@ -747,7 +1451,7 @@ class ImageViewer(QGraphicsView):
         self._update_weather_icon_size()
         self._apply_weather_stylesheet()
         self._update_weather_display()
-        self._update_overlay_positions()
+        self._recompute_overlay_layout()
 
     def _calculate_weather_icon_size(self):
         point_size = max(1.0, float(self.weather_font_size))
@@ -771,7 +1475,7 @@ class ImageViewer(QGraphicsView):
         if self._weather_icon_key:
             cached = self._icon_cache.get(self._weather_icon_key)
             if isinstance(cached, QPixmap) and not cached.isNull():
-                self._apply_weather_icon(cached)
+                self._apply_weather_icon(cached, self._weather_icon_key)
                 return
 
         if not self._weather_icon_pixmap.isNull():
@@ -780,12 +1484,40 @@ class ImageViewer(QGraphicsView):
             target = int(self._weather_icon_size)
             self.weather_icon_label.setFixedSize(target, target)
 
-    def _update_overlay_positions(self):
+    def _recompute_overlay_layout(self):
+        # Several triggers usually fire together (new image, resize, weather
+        # refresh); lay the overlays out once when control returns to the
+        # event loop.
+        if not self._overlay_timer.isActive():
+            self._overlay_timer.start()
+
+    def _flush_overlay_layout(self):
+        rect = self._get_displayed_pixmap_rect()
+        state = (
+            self._vp_w,
+            self._vp_h,
+            rect.x(),
+            rect.y(),
+            rect.width(),
+            rect.height(),
+            self._metadata_render_key,
+            self.metadata_label.isVisible(),
+            self._weather_text,
+            self._weather_icon_key,
+            # The icon arrives after its key is set, so track the pixmap too.
+            self._weather_icon_pixmap.cacheKey(),
+            self._weather_icon_size,
+            self.weather_container.isVisible(),
+            self.weather_font_size,
+        )
+        if state == self._last_overlay_state:
+            return
+        self._last_overlay_state = state
         self._update_weather_position()
         self._update_metadata_position()
 
     def _calculate_metadata_max_width(self):
-        viewport_limit = max(0, self.viewport().width() - self.overlay_margin * 2)
+        viewport_limit = max(0, self._vp_w - self.overlay_margin * 2)
         if viewport_limit <= 0:
             return 0
 
@@ -800,8 +1532,9 @@ class ImageViewer(QGraphicsView):
         if self.pixmap_item.pixmap().isNull():
             return QRectF()
 
-        transform = self.transform()
-        return transform.mapRect(self.pixmap_item.boundingRect())
+        if self._displayed_rect is None:
+            self._displayed_rect = self.transform().mapRect(self.pixmap_item.boundingRect())
+        return self._displayed_rect
 
     def _update_metadata_label(self):
         folder_text = self._photo_folder_text.strip()
@@ -812,39 +1545,86 @@ class ImageViewer(QGraphicsView):
         if max_width > 0:
             available_width = max(0, max_width - self.metadata_horizontal_padding)
 
-        segments = []
+        key = (
+            folder_text,
+            date_text,
+            self.folder_font_size,
+            self.date_font_size,
+            available_width,
+            self.devicePixelRatioF(),
+        )
+        if key == self._metadata_render_key:
+            return
+        self._metadata_render_key = key
+
+        lines = []
         if folder_text:
-            display_folder = self._elide_metadata_text(
-                folder_text, self.folder_font_size, available_width
-            )
-            segments.append(
-                "<div style=\"font-size:{:.1f}pt; font-weight:600;\">{}</div>".format(
-                    self.folder_font_size,
-                    html.escape(display_folder),
-                )
+            lines.append(
+                self._metadata_line(folder_text, self.folder_font_size, 600, available_width)
             )
         if date_text:
-            display_date = self._elide_metadata_text(
-                date_text, self.date_font_size, available_width
-            )
-            segments.append(
-                "<div style=\"font-size:{:.1f}pt;\">{}</div>".format(
-                    self.date_font_size,
-                    html.escape(display_date),
-                )
+            lines.append(
+                self._metadata_line(date_text, self.date_font_size, 400, available_width)
             )
 
-        if segments:
-            combined = "".join(segments)
-            self.metadata_label.setText(
-                f"<div style='text-align:center; white-space:nowrap;'>{combined}</div>"
-            )
+        if lines:
+            self.metadata_label.setPixmap(self._render_metadata_pixmap(lines))
             self.metadata_label.setVisible(True)
             self.metadata_label.raise_()
         else:
-            self.metadata_label.setText("")
+            self.metadata_label.clear()
             self.metadata_label.setVisible(False)
 
+    def _metadata_line(self, text, point_size, weight, max_width):
+        font, metrics = self._metadata_font(point_size, weight)
+        # Consecutive photos usually share a folder, so the same line is
+        # elided for the same width over and over.
+        key = (text, point_size, weight, max_width)
+        elided = self._metadata_elide_cache.get(key)
+        if elided is None:
+            if len(self._metadata_elide_cache) >= 256:
+                self._metadata_elide_cache.clear()
+            elided = self._elide_metadata_text(text, metrics, max_width)
+            self._metadata_elide_cache[key] = elided
+        return elided, font, metrics
+
+    def _render_metadata_pixmap(self, lines):
+        """Paint the metadata lines and their rounded background once so the
+        label only blits a pixmap."""
+        ratio = self.devicePixelRatioF()
+        text_width = max(metrics.horizontalAdvance(text) for text, _, metrics in lines)
+        text_height = sum(metrics.height() for _, _, metrics in lines)
+        pad_x = self.metadata_horizontal_padding / 2
+        pad_y = self.metadata_vertical_padding / 2
+        width = text_width + self.metadata_horizontal_padding
+        height = text_height + self.metadata_vertical_padding
+
+        pixmap = QPixmap(max(1, math.ceil(width * ratio)), max(1, math.ceil(height * ratio)))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHints(
+            QPainter.RenderHint.Antialiasing | QPainter.RenderHint.TextAntialiasing
+        )
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(0, 0, 0, 180))
+        radius = self.metadata_corner_radius
+        painter.drawRoundedRect(QRectF(0, 0, width, height), radius, radius)
+
+        painter.setPen(Qt.GlobalColor.white)
+        y = pad_y
+        for text, font, metrics in lines:
+            painter.setFont(font)
+            painter.drawText(
+                QRectF(pad_x, y, text_width, metrics.height()),
+                Qt.AlignmentFlag.AlignCenter,
+                text,
+            )
+            y += metrics.height()
+        painter.end()
+        return pixmap
+
     def _update_metadata_position(self):
         if not self.metadata_label.isVisible():
             return
@@ -852,6 +1632,8 @@ class ImageViewer(QGraphicsView):
         max_width = self._calculate_metadata_max_width()
         if max_width <= 0:
             self.metadata_label.setVisible(False)
+            # Let the next label update render and show the caption again.
+            self._metadata_render_key = None
             return
 
         self.metadata_label.setMaximumWidth(max_width)
@@ -860,82 +1642,95 @@ class ImageViewer(QGraphicsView):
         label_width = self.metadata_label.width()
         label_height = self.metadata_label.height()
 
-        x = (self.viewport().width() - label_width) / 2
+        x = (self._vp_w - label_width) / 2
         min_x = self.overlay_margin
-        max_x = self.viewport().width() - label_width - self.overlay_margin
+        max_x = self._vp_w - label_width - self.overlay_margin
         if max_x < min_x:
             x = min_x
         else:
             x = max(min_x, min(x, max_x))
-        y = self.viewport().height() - label_height - self.overlay_margin
+        y = self._vp_h - label_height - self.overlay_margin
         self.metadata_label.move(int(x), int(y))
 
     def _set_photo_metadata(self, image_path):
-        folder_name = os.path.basename(os.path.dirname(image_path))
-        photo_date = self._extract_photo_date(image_path)
-        if not photo_date:
-            try:
-                timestamp = os.path.getmtime(image_path)
-            except (OSError, ValueError):
-                timestamp = None
-            if timestamp is not None:
-                fallback_dt = datetime.fromtimestamp(timestamp)
-                photo_date = self._format_display_date(fallback_dt)
+        folder_name = _folder_name_for_path(image_path)
+        try:
+            stat = os.stat(image_path)
+        except (OSError, ValueError):
+            stat = None
+
+        photo_date = ""
+        if stat is not None:
+            # Keyed on mtime and size so an edited file is read again.
+            photo_date = _cached_photo_date(image_path, stat.st_mtime_ns, stat.st_size)
+            if not photo_date:
+                local = time.localtime(stat.st_mtime)
+                photo_date = _format_month_day_year(local.tm_year, local.tm_mon, local.tm_mday)
         self._photo_folder_text = folder_name or ""
         self._photo_date_text = photo_date or ""
 
-    def _extract_photo_date(self, image_path):
-        try:
-            with Image.open(image_path) as img:
-                if hasattr(img, "getexif"):
-                    exif_data = img.getexif()
-                else:
-                    exif_data = img._getexif()
-        except Exception:
-            return ""
-
-        if not exif_data:
-            return ""
+    @staticmethod
+    def _extract_photo_date(image_path):
+        # JPEGs are read straight from their APP1 segment and formats without
+        # EXIF are skipped; anything else goes through Pillow, which still
+        # only parses the header.
+        dates = read_exif_dates(image_path)
+        if dates is None:
+            dates = ImageViewer._read_exif_dates_with_pil(image_path)
 
         for tag_name in EXIF_DATE_TAG_NAMES:
-            tag_id = EXIF_TAG_NAME_TO_ID.get(tag_name)
-            if tag_id is None:
-                continue
-            value = exif_data.get(tag_id)
-            formatted = self._format_exif_datetime(value)
+            formatted = ImageViewer._format_exif_datetime(dates.get(tag_name))
             if formatted:
                 return formatted
         return ""
 
+    @staticmethod
+    def _read_exif_dates_with_pil(image_path):
+        try:
+            # Image.open only parses the header; the pixels are never loaded.
+            with Image.open(image_path) as img:
+                exif_data = img.getexif()
+                exif_ifd = exif_data.get_ifd(EXIF_IFD_POINTER_TAG) if exif_data else {}
+        except Exception:
+            return {}
+
+        dates = {}
+        for tag_name, tag_id in EXIF_DATE_TAGS:
+            # The capture dates live in the Exif sub-IFD, DateTime in IFD0.
+            value = exif_ifd.get(tag_id, exif_data.get(tag_id))
+            if value is not None:
+                dates[tag_name] = value
+        return dates
+
     @staticmethod
     def _format_exif_datetime(value):
-        if value is None:
+        # EXIF dates almost always arrive as str, so test for that first.
+        if isinstance(value, str):
+            text = value
+        elif value is None:
             return ""
-
-        if isinstance(value, datetime):
+        elif isinstance(value, date):
             return ImageViewer._format_display_date(value)
-
-        if isinstance(value, date):
-            return ImageViewer._format_display_date(
-                datetime(value.year, value.month, value.day)
-            )
-
-        if isinstance(value, bytes):
+        elif isinstance(value, bytes):
             try:
-                value = value.decode("utf-8", errors="ignore")
+                text = value.decode("utf-8", errors="ignore")
             except Exception:
                 try:
-                    value = value.decode(errors="ignore")
+                    text = value.decode(errors="ignore")
                 except Exception:
                     return ""
+        else:
+            text = str(value)
 
-        text = str(value).strip()
+        text = text.strip()
         if not text:
             return ""
 
-        replacements = {"/": "-", "T": " ", "\u0000": ""}
-        for src, dst in replacements.items():
-            text = text.replace(src, dst)
+        text = text.translate(EXIF_DATETIME_TRANSLATION)
+
+        parsed = _parse_exif_datetime_text(text)
+        if parsed is not None:
+            return ImageViewer._format_display_date(parsed)
 
         datetime_formats = [
             "%Y:%m:%d %H:%M:%S",
@@ -957,27 +1752,31 @@ class ImageViewer(QGraphicsView):
 
     @staticmethod
     def _format_display_date(value):
-        if isinstance(value, datetime):
-            dt = value
-        elif isinstance(value, date):
-            dt = datetime(value.year, value.month, value.day)
-        else:
+        # datetime is a subclass of date, so this covers both.
+        if not isinstance(value, date):
             return ""
+        return _format_month_day_year(value.year, value.month, value.day)
 
-        month = dt.strftime("%B")
-        return f"{month} {dt.day}, {dt.year}"
-
-    def _elide_metadata_text(self, text, point_size, max_width):
+    @staticmethod
+    def _elide_metadata_text(text, metrics, max_width):
         if not text:
             return ""
         if not max_width or max_width <= 0:
             return text
 
-        font = QFont(self.metadata_label.font())
-        font.setPointSizeF(point_size)
-        metrics = QFontMetrics(font)
         return metrics.elidedText(text, Qt.TextElideMode.ElideMiddle, int(max_width))
 
+    def _metadata_font(self, point_size, weight):
+        key = (point_size, weight)
+        cached = self._metadata_font_cache.get(key)
+        if cached is None:
+            font = QFont(self.metadata_label.font())
+            font.setPointSizeF(point_size)
+            font.setWeight(QFont.Weight(weight))
+            cached = (font, QFontMetrics(font))
+            self._metadata_font_cache[key] = cached
+        return cached
+
     def set_weather_overlay(self, weather):
         text, icon_hint = self._normalize_weather_overlay(weather)
         icon_key, icon_url = self._resolve_icon_sources(icon_hint)
@@ -993,6 +1792,14 @@ class ImageViewer(QGraphicsView):
             self._update_weather_display()
 
     def _update_weather_display(self):
+        render_key = (
+            self._weather_text,
+            self._weather_icon_pixmap.cacheKey() if not self._weather_icon_pixmap.isNull() else 0,
+        )
+        if render_key == self._weather_render_key:
+            return
+        self._weather_render_key = render_key
+
         display_text = self._weather_text or ""
         if display_text:
             raw_lines = display_text.split("\n")
@@ -1021,36 +1828,38 @@ class ImageViewer(QGraphicsView):
             if text:
                 label.setText(self._render_weather_body_html(text))
                 label.setVisible(True)
-            else:
-                label.clear()
-                label.setVisible(False)
-
-        apply_html(self.weather_location_label, location_text)
-        apply_html(self.weather_temperature_label, temperature_text)
-        apply_html(self.weather_condition_label, summary_text)
-        apply_html(self.weather_feels_like_label, feels_like_text)
-        apply_html(self.weather_humidity_wind_label, humidity_wind_text)
-        apply_html(self.weather_sun_label, sun_text)
-        apply_html(self.weather_updated_label, updated_text)
-
-        should_show = (
-            self.weather_location_label.isVisible()
-            or self.weather_temperature_label.isVisible()
-            or self.weather_condition_label.isVisible()
-            or self.weather_feels_like_label.isVisible()
-            or self.weather_humidity_wind_label.isVisible()
-            or self.weather_sun_label.isVisible()
-            or self.weather_updated_label.isVisible()
-            or has_icon
-        )
+                return True
+            label.clear()
+            label.setVisible(False)
+            return False
+
+        shown = [
+            apply_html(self.weather_location_label, location_text),
+            apply_html(self.weather_temperature_label, temperature_text),
+            apply_html(self.weather_condition_label, summary_text),
+            apply_html(self.weather_feels_like_label, feels_like_text),
+            apply_html(self.weather_humidity_wind_label, humidity_wind_text),
+            apply_html(self.weather_sun_label, sun_text),
+            apply_html(self.weather_updated_label, updated_text),
+        ]
+
+        # isVisible() is False for every label while the container itself is
+        # hidden, so go by what was just applied instead.
+        should_show = any(shown) or has_icon
         self.weather_container.setVisible(should_show)
         if should_show:
             self.weather_container.raise_()
 
-        self._update_overlay_positions()
+        self._recompute_overlay_layout()
 
     def _apply_weather_stylesheet(self):
         emoji_font_family = self._ensure_weather_icon_font()
+        # Every setStyleSheet call re-parses CSS and re-polishes the widget,
+        # so only restyle when an input to the sheets actually changed.
+        style_key = (self.weather_font_size, emoji_font_family)
+        if style_key == self._weather_style_key:
+            return
+        self._weather_style_key = style_key
 
         self.weather_container.setStyleSheet(
             "background-color: rgba(0, 0, 0, 180); border-radius: 12px;"
@@ -1119,17 +1928,10 @@ class ImageViewer(QGraphicsView):
         escaped = html.escape(body_text)
         for count in (3, 2):
             escaped = escaped.replace(" " * count, "&nbsp;" * count)
-        for sequence in sorted(self._WEATHER_EMOJI_SEQUENCES, key=len, reverse=True):
-            if not sequence:
-                continue
-            escaped_sequence = html.escape(sequence)
-            if escaped_sequence not in escaped:
-                continue
-            replacement = (
-                f"<span style=\"font-family: '{emoji_font_family}', sans-serif;\">"
-                f"{escaped_sequence}</span>"
-            )
-            escaped = escaped.replace(escaped_sequence, replacement)
+        span_open = f"<span style=\"font-family: '{emoji_font_family}', sans-serif;\">"
+        escaped = self._WEATHER_EMOJI_RE.sub(
+            lambda match: span_open + match.group(0) + "</span>", escaped
+        )
         return escaped.replace("\n", "<br/>")
 
     @classmethod
@@ -1137,24 +1939,50 @@ class ImageViewer(QGraphicsView):
         if cls._emoji_font_family:
             return cls._emoji_font_family
 
-        emoji_font_paths = (
-            Path("/usr/share/fonts/truetype/noto/NotoColorEmoji.ttf"),
-            Path("/usr/share/fonts/opentype/noto/NotoColorEmoji.ttf"),
-        )
-
-        for path in emoji_font_paths:
-            if not path.exists():
-                continue
+        def register_font(path):
             font_id = QFontDatabase.addApplicationFont(str(path))
             if font_id == -1:
-                continue
+                return None
             families = QFontDatabase.applicationFontFamilies(font_id)
-            if families:
-                cls._emoji_font_family = families[0]
-                break
+            return families[0] if families else None
+
+        # A previous launch may already have resolved the font; "" records
+        # that none of the candidates were available.
+        try:
+            cached_path = EMOJI_FONT_CACHE_FILE.read_text().strip()
+        except OSError:
+            cached_path = None
+        if cached_path and Path(cached_path).exists():
+            cls._emoji_font_family = register_font(cached_path)
+        elif cached_path is None or cached_path:
+            emoji_font_paths = (
+                Path("/usr/share/fonts/truetype/noto/NotoColorEmoji.ttf"),
+                Path("/usr/share/fonts/opentype/noto/NotoColorEmoji.ttf"),
+            )
+
+            resolved_path = ""
+            for path in emoji_font_paths:
+                if not path.exists():
+                    continue
+                family = register_font(path)
+                if family:
+                    cls._emoji_font_family = family
+                    resolved_path = str(path)
+                    break
+
+            try:
+                EMOJI_FONT_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+                EMOJI_FONT_CACHE_FILE.write_text(resolved_path)
+            except OSError as exc:
+                print(f"Failed to cache emoji font path: {exc}")
 
         if not cls._emoji_font_family:
-            cls._emoji_font_family = "Noto Color Emoji"
+            # Fall back to an installed emoji family, looked up once.
+            installed = set(QFontDatabase.families())
+            cls._emoji_font_family = next(
+                (name for name in cls._EMOJI_FONT_FAMILIES if name in installed),
+                "Noto Color Emoji",
+            )
 
         return cls._emoji_font_family
 
@@ -1162,9 +1990,11 @@ class ImageViewer(QGraphicsView):
         if not self.weather_container.isVisible():
             return
 
-        max_width = max(0, self.viewport().width() - self.overlay_margin * 2)
+        max_width = max(0, self._vp_w - self.overlay_margin * 2)
         if max_width <= 0:
             self.weather_container.setVisible(False)
+            # Let the next display update rebuild and show the panel again.
+            self._weather_render_key = None
             return
 
         margins = self.weather_layout.contentsMargins()
@@ -1275,8 +2105,10 @@ class ImageViewer(QGraphicsView):
         self._weather_icon_key = icon_key
 
         cached = self._icon_cache.get(icon_key)
+        if cached is None:
+            cached = self._load_cached_icon(icon_key)
         if isinstance(cached, QPixmap) and not cached.isNull():
-            self._apply_weather_icon(cached)
+            self._apply_weather_icon(cached, icon_key)
             self._update_weather_display()
             return
 
@@ -1293,18 +2125,53 @@ class ImageViewer(QGraphicsView):
         self._pending_icon_reply.finished.connect(self._on_icon_download_finished)  # type: ignore[arg-type]
         self._update_weather_display()
 
-    def _apply_weather_icon(self, pixmap):
+    @staticmethod
+    def _icon_cache_path(icon_key):
+        digest = hashlib.sha1(icon_key.encode("utf-8")).hexdigest()
+        return ICON_CACHE_DIR / f"{digest}.png"
+
+    def _load_cached_icon(self, icon_key):
+        """Return the icon stored on disk by a previous run, if any."""
+        path = self._icon_cache_path(icon_key)
+        if not path.is_file():
+            return None
+        pixmap = QPixmap(str(path))
+        if pixmap.isNull():
+            return None
+        self._icon_cache[icon_key] = pixmap
+        return pixmap
+
+    def _store_cached_icon(self, icon_key, data):
+        try:
+            ICON_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            self._icon_cache_path(icon_key).write_bytes(data)
+        except OSError as exc:
+            print(f"Failed to cache weather icon: {exc}")
+
+    def _apply_weather_icon(self, pixmap, icon_key=None):
         if pixmap.isNull():
             self._clear_weather_icon()
             return
 
         target_size = int(self._weather_icon_size)
-        scaled = pixmap.scaled(
-            target_size,
-            target_size,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
-        )
+        cache_key = (icon_key, target_size) if icon_key else None
+        scaled = self._icon_scaled_cache.get(cache_key) if cache_key else None
+        if scaled is None:
+            scaled = pixmap.scaled(
+                target_size,
+                target_size,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+            if cache_key:
+                self._icon_scaled_cache[cache_key] = scaled
+        elif (
+            scaled.cacheKey() == self._weather_icon_pixmap.cacheKey()
+            and self.weather_icon_label.isVisibleTo(self.weather_container)
+        ):
+            # Already showing this exact pixmap at this size.
+            return
+
         self._weather_icon_pixmap = scaled
         self.weather_icon_label.setPixmap(scaled)
         self.weather_icon_label.setFixedSize(target_size, target_size)
@@ -1360,9 +2227,10 @@ class ImageViewer(QGraphicsView):
             return
 
         self._icon_cache[icon_key] = pixmap
+        self._store_cached_icon(icon_key, data)
 
         if icon_key == self._weather_icon_key:
-            self._apply_weather_icon(pixmap)
+            self._apply_weather_icon(pixmap, icon_key)
             self._update_weather_display()
 
     @staticmethod
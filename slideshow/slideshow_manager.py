@@ -8,6 +8,9 @@ from utils.weather_client import WeatherClient
 
 SUPPORTED_IMAGE_FORMATS = ('.jpg', '.jpeg', '.png', '.bmp', '.gif', '.webp')
 
+# How many upcoming images get their EXIF dates read ahead of time.
+METADATA_PREFETCH_COUNT = 3
+
 LEGACY_TRANSITION_ALIASES = {
     "slide": ["slide-horizontal", "slide-vertical"],
 }
@@ -162,6 +165,16 @@ class SlideshowManager(QWidget):
             duration=self.duration,
             transition=transition,
         )
+        if len(self.images) > 1:
+            next_index = (self.current_index + 1) % len(self.images)
+            self.viewer.preload(self.images[next_index])
+            upcoming = min(METADATA_PREFETCH_COUNT, len(self.images) - 1)
+            self.viewer.prefetch_metadata(
+                [
+                    self.images[(self.current_index + offset) % len(self.images)]
+                    for offset in range(1, upcoming + 1)
+                ]
+            )
 
     def next_image(self):
         if not self.images or self.blackout_active:
@@ -0,0 +1,120 @@
+"""Minimal EXIF reader that pulls capture dates out of image headers."""
+from __future__ import annotations
+
+import mmap
+import struct
+from typing import Dict, Optional
+
+EXIF_IFD_POINTER_TAG = 0x8769
+
+_DATE_TAGS = {
+    0x0132: "DateTime",
+    0x9003: "DateTimeOriginal",
+    0x9004: "DateTimeDigitized",
+}
+_ASCII_TYPE = 2
+_SOS_MARKER = 0xDA
+_EOI_MARKER = 0xD9
+_APP1_MARKER = 0xE1
+
+# Formats that cannot carry EXIF at all.
+_NO_EXIF_SIGNATURES = (b"BM", b"GIF87a", b"GIF89a")
+
+
+def read_exif_dates(path: str) -> Optional[Dict[str, str]]:
+    """Return the EXIF date strings of an image keyed by tag name.
+
+    JPEGs are parsed from their header segments, so no pixel data is decoded;
+    BMP and GIF files are recognised by signature and yield no dates. Returns
+    ``None`` for any other format, or when a JPEG's EXIF block cannot be
+    parsed, letting callers fall back to a full EXIF parser.
+    """
+    try:
+        with open(path, "rb") as handle:
+            head = handle.read(12)
+            if not head.startswith(b"\xff\xd8"):
+                return {} if head.startswith(_NO_EXIF_SIGNATURES) else None
+            # Map the file instead of reading the APP1 segment: only the pages
+            # holding the markers and the date IFDs get touched, not the
+            # embedded thumbnail that makes up most of the segment.
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return _scan_jpeg_dates(data)
+    except (OSError, ValueError):
+        return None
+
+
+def _scan_jpeg_dates(data: mmap.mmap) -> Optional[Dict[str, str]]:
+    offset = 2
+    size = len(data)
+    while offset + 4 <= size:
+        if data[offset] != 0xFF:
+            return None
+        marker = data[offset + 1]
+        if marker in (_SOS_MARKER, _EOI_MARKER):
+            # Image data starts here; there was no EXIF segment.
+            return {}
+        (length,) = struct.unpack_from(">H", data, offset + 2)
+        segment = offset + 4
+        end = offset + 2 + length
+        if marker == _APP1_MARKER and data[segment:segment + 6] == b"Exif\x00\x00":
+            return _parse_tiff_dates(data, segment + 6, min(end, size))
+        offset = end
+    return None
+
+
+def _parse_tiff_dates(data: mmap.mmap, base: int, end: int) -> Optional[Dict[str, str]]:
+    byte_order = data[base:base + 2]
+    if byte_order == b"II":
+        endian = "<"
+    elif byte_order == b"MM":
+        endian = ">"
+    else:
+        return None
+
+    dates: Dict[str, str] = {}
+    try:
+        (ifd0_offset,) = struct.unpack_from(endian + "I", data, base + 4)
+        exif_offset = _read_ifd_dates(data, endian, base, end, ifd0_offset, dates)
+        if exif_offset:
+            _read_ifd_dates(data, endian, base, end, exif_offset, dates)
+    except struct.error:
+        return None
+    return dates
+
+
+def _read_ifd_dates(
+    data: mmap.mmap,
+    endian: str,
+    base: int,
+    end: int,
+    offset: int,
+    dates: Dict[str, str],
+) -> Optional[int]:
+    """Collect date tags from the IFD at ``offset``; return the Exif IFD pointer.
+
+    Offsets are relative to the TIFF header at ``base``; ``end`` bounds the
+    APP1 segment.
+    """
+    (count,) = struct.unpack_from(endian + "H", data, base + offset)
+    if base + offset + 2 + count * 12 > end:
+        raise struct.error("IFD runs past the APP1 segment")
+    exif_offset = None
+    for index in range(count):
+        entry = base + offset + 2 + index * 12
+        tag, value_type, value_count, value = struct.unpack_from(
+            endian + "HHII", data, entry
+        )
+        if tag == EXIF_IFD_POINTER_TAG:
+            exif_offset = value
+        elif tag in _DATE_TAGS and value_type == _ASCII_TYPE:
+            if value_count <= 4:
+                start = entry + 8
+            else:
+                start = base + value
+            if start + value_count > end:
+                continue
+            raw = data[start:start + value_count]
+            text = raw.split(b"\x00", 1)[0].decode("ascii", errors="ignore").strip()
+            if text:
+                dates[_DATE_TAGS[tag]] = text
+    return exif_offset